@@ -4,61 +4,370 @@ Configuration Validation Script
 Validates all configuration files in the ProxMox homelab setup
 """
 
+import argparse
+import functools
+import importlib.util
 import json
-import yaml
 import os
 import sys
-import ipaddress
+import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# PyYAML, fastjsonschema, orjson and ipaddress are imported on first use to keep
+# start-up cheap when every file is served from the validation cache
+
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use"""
+    import yaml
+    return yaml
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """Prefer the libyaml C loader (PyYAML built against libyaml); fall back to
+    the pure-Python loader when it is unavailable"""
+    yaml = _yaml()
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=None)
+def _fastjsonschema():
+    """Import fastjsonschema on first use, or None when it is not installed"""
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    return fastjsonschema
+
+@functools.lru_cache(maxsize=None)
+def _ipaddress():
+    """Import ipaddress on first use"""
+    import ipaddress
+    return ipaddress
+
+@functools.lru_cache(maxsize=None)
+def _json_loads():
+    """Return orjson.loads when installed, else json.loads; both accept bytes
+    and orjson.JSONDecodeError subclasses json.JSONDecodeError"""
+    try:
+        from orjson import loads
+    except ImportError:
+        return json.loads
+    return loads
+
+SCHEMA_DIR = Path(__file__).parent.parent / 'config' / 'schemas'
+CACHE_FILE = '.validate-cache.json'
+
+# An exact match here is always a valid IPv4 network (host bits are allowed),
+# so ipaddress is only consulted for IPv6, netmask notation and other edge cases
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])'
+_IPV4_CIDR_RE = re.compile(rf'{_OCTET}(?:\.{_OCTET}){{3}}(?:/(?:3[0-2]|[12]?[0-9]))?')
+# Anything with characters outside this set can never be an IP network; both
+# patterns are used with fullmatch() so a trailing newline is not accepted
+_NETWORK_CHARS_RE = re.compile(r'[0-9A-Za-z:.%/]+')
+
+# Marks a schema path that is absent from the config, as opposed to present and null
+_MISSING = object()
+
+# VMID ranges such as "200-209"
+_VMID_RANGE_RE = re.compile(r'([0-9]+)-([0-9]+)')
+
+def _is_cidr(value: str) -> bool:
+    """Schema format check for IPv4/IPv6 network notation"""
+    if not isinstance(value, str) or not _NETWORK_CHARS_RE.fullmatch(value):
+        return False
+    if _IPV4_CIDR_RE.fullmatch(value):
+        return True
+    try:
+        _ipaddress().ip_network(value, strict=False)
+        return True
+    except ValueError:
+        return False
+
+def _is_ipv4(value: str) -> bool:
+    """Schema format check for a single IPv4 address"""
+    try:
+        _ipaddress().IPv4Address(value)
+        return True
+    except ValueError:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def _schema(name: str) -> Dict:
+    """Load a JSON schema from SCHEMA_DIR on first use"""
+    with open(SCHEMA_DIR / f"{name}.schema.json", 'r') as f:
+        return json.load(f)
+
+def _schema_units(schema: Dict, path: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], Dict]]:
+    """Split a schema at every 'properties' level into (path, sub-schema) units"""
+    # A compiled validator stops at its first violation; validating each unit
+    # separately reports one violation per object instead of one per file
+    properties = schema.get('properties')
+    if not properties:
+        return [(path, schema)]
+    # The object's own checks (type, required, additionalProperties) without its children
+    units = [(path, {**schema, 'properties': {key: {} for key in properties}})]
+    for key, subschema in properties.items():
+        units.extend(_schema_units(subschema, path + (key,)))
+    return units
+
+# Python types accepted for each JSON schema type when fastjsonschema is missing
+_JSON_TYPES = {'object': dict, 'array': list, 'string': str, 'integer': int,
+               'number': (int, float), 'boolean': bool, 'null': type(None)}
+
+def _compiled_check(validator: Any) -> Any:
+    """Wrap a compiled fastjsonschema validator to return its message, or None"""
+    def check(value: Any) -> Optional[str]:
+        try:
+            validator(value)
+        except _fastjsonschema().JsonSchemaException as e:
+            # Messages name the checked value 'data'; the caller prefixes its real location
+            return e.message[len('data'):] if e.message.startswith('data') else f" {e.message}"
+        return None
+    return check
+
+def _type_check(unit: Dict) -> Any:
+    """Check only the 'type' keyword of a schema unit, worded like fastjsonschema"""
+    types = unit.get('type', [])
+    types = [types] if isinstance(types, str) else types
+    def check(value: Any) -> Optional[str]:
+        if not types:
+            return None
+        # bool is an int subclass but only matches 'boolean'
+        if isinstance(value, bool):
+            matched = 'boolean' in types
+        else:
+            matched = any(isinstance(value, _JSON_TYPES[t]) for t in types)
+        return None if matched else f" must be {' or '.join(types)}"
+    return check
+
+@functools.lru_cache(maxsize=None)
+def _schema_checks(name: str) -> Tuple[List[Tuple[Tuple[str, ...], Any]], bool]:
+    """Build the nested checks of a schema and whether they are complete"""
+    # The top level is checked in Python so both paths report it the same way
+    units = [(path, unit) for path, unit in _schema_units(_schema(name)) if path]
+    fastjsonschema = _fastjsonschema()
+    if fastjsonschema is None:
+        # Section types are still checked so the semantic validators can walk
+        # the config safely; formats, patterns and bounds are not
+        return [(path, _type_check(unit)) for path, unit in units], False
+    formats = {'cidr': _is_cidr, 'ipv4': _is_ipv4}
+    return [(path, _compiled_check(fastjsonschema.compile(unit, formats=formats)))
+            for path, unit in units], True
+
+def _canonical(value: Any) -> Any:
+    """Convert parsed YAML/JSON into a JSON-serialisable form for hashing"""
+    # YAML allows non-string keys (an unquoted 'on:' loads as True, '80:' as 80)
+    # and non-JSON scalars such as dates; tag them with their type so that e.g.
+    # a date and the equivalent quoted string do not hash the same
+    if isinstance(value, dict):
+        return {f"{type(key).__name__}:{key}": _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return {'__type__': type(value).__name__, 'value': sorted(repr(item) for item in value)}
+    return {'__type__': type(value).__name__, 'value': repr(value)}
 
 class ConfigValidator:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, interactive: Optional[bool] = None):
         self.errors = []
         self.warnings = []
+        self.error_count = 0
+        self.warning_count = 0
+        self.successes = 0
         self.project_root = Path(__file__).parent.parent
+        self.use_cache = use_cache
+        self._cache = self._load_cache() if use_cache else {}
+        # On a terminal lines are shown as they happen; otherwise they are buffered
+        # and written in one go by flush_output()
+        self.interactive = sys.stdout.isatty() if interactive is None else interactive
+        self._out = []
+    
+    def _emit(self, line: str):
+        """Write a line immediately on a terminal, buffer it otherwise"""
+        if self.interactive:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+        else:
+            self._out.append(line)
+    
+    def flush_output(self):
+        """Write all buffered output with a single call"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
         
     def log_error(self, message: str):
         """Log an error message"""
-        self.errors.append(f"❌ ERROR: {message}")
-        print(f"❌ ERROR: {message}")
+        self.errors.append(message)
+        self.error_count += 1
+        self._emit(f"❌ ERROR: {message}")
     
     def log_warning(self, message: str):
         """Log a warning message"""
-        self.warnings.append(f"⚠️  WARNING: {message}")
-        print(f"⚠️  WARNING: {message}")
+        self.warnings.append(message)
+        self.warning_count += 1
+        self._emit(f"⚠️  WARNING: {message}")
     
     def log_success(self, message: str):
         """Log a success message"""
-        print(f"✅ {message}")
+        self.successes += 1
+        self._emit(f"✅ {message}")
     
-    def validate_yaml_file(self, file_path: Path) -> Optional[Dict]:
-        """Validate YAML file syntax and return parsed content"""
+    @staticmethod
+    def _validator_signature() -> List[List[Any]]:
+        """Stat of this script, its schemas and parser dependencies; any change invalidates the cache"""
+        sources = [Path(__file__)] + sorted(SCHEMA_DIR.glob('*.schema.json'))
+        signature = []
+        for source in sources:
+            st = source.stat()
+            signature.append([source.name, st.st_mtime_ns, st.st_size])
+        
+        # A file that passed the top-level-only fallback must be rechecked once
+        # fastjsonschema is available, and a PyYAML upgrade or a switch between
+        # the C and pure-Python loaders may parse differently. Modules are located
+        # without importing them; the stat of the installed package stands in
+        # for its version.
+        for module in ('fastjsonschema', 'yaml'):
+            spec = importlib.util.find_spec(module)
+            if spec is None or not spec.origin:
+                signature.append([module, None])
+                continue
+            st = os.stat(spec.origin)
+            entry = [module, spec.origin, st.st_mtime_ns, st.st_size]
+            if module == 'yaml':
+                has_libyaml = any(Path(spec.origin).parent.glob('_yaml.*'))
+                entry.append('CSafeLoader' if has_libyaml else 'SafeLoader')
+            signature.append(entry)
+        return signature
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load stat keys, content hashes and warnings of files that passed without errors"""
         try:
-            with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
-            self.log_success(f"YAML syntax valid: {file_path}")
+            with open(self.project_root / CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get('signature') != self._validator_signature():
+            return {}
+        return cache.get('files', {})
+    
+    def _save_cache(self):
+        """Persist cache entries of files that passed without errors"""
+        cache = {'signature': self._validator_signature(), 'files': self._cache}
+        try:
+            # Only ever read back by this script, so skip the whitespace
+            with open(self.project_root / CACHE_FILE, 'w') as f:
+                json.dump(cache, f, separators=(',', ':'))
+        except OSError as e:
+            self.log_warning(f"Could not write validation cache: {e}")
+    
+    @staticmethod
+    def _stat_key(entry: os.DirEntry) -> List[int]:
+        """Cache key for a file: modification time and size (stat is cached on the entry)"""
+        st = entry.stat()
+        return [st.st_mtime_ns, st.st_size]
+    
+    @staticmethod
+    def _scan_present(file_paths: List[Path]) -> Dict[str, os.DirEntry]:
+        """List each parent directory once and map present file paths to their entries"""
+        present = {}
+        for directory in {str(file_path.parent) for file_path in file_paths}:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            present[entry.path] = entry
+            except FileNotFoundError:
+                continue
+        return present
+    
+    @staticmethod
+    def _content_hash(content: Any) -> str:
+        """SHA-256 of the canonical JSON form, blind to comments and formatting"""
+        import hashlib  # only needed when the cache is in use
+        canon = json.dumps(_canonical(content), sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canon.encode()).hexdigest()
+    
+    def _replay_warnings(self, config_file: str):
+        """Report the warnings a cached file produced when it was last validated"""
+        for warning in self._cache.get(config_file, {}).get('warnings', []):
+            self.log_warning(warning)
+    
+    @staticmethod
+    def _parse_one(target: Tuple[Any, str]) -> Tuple[Any, str, Any, Optional[Exception]]:
+        """Read and parse a single file, returning the error instead of logging it"""
+        file_path, kind = target
+        syntax_error = _yaml().YAMLError if kind == 'yaml' else json.JSONDecodeError
+        try:
+            if kind == 'yaml':
+                with open(file_path, 'r') as f:
+                    content = _yaml().load(f, Loader=_yaml_loader())
+            else:
+                with open(file_path, 'rb') as f:
+                    content = _json_loads()(f.read())
+            return file_path, kind, content, None
+        except (syntax_error, FileNotFoundError) as e:
+            return file_path, kind, None, e
+    
+    def _report_parse(self, file_path: Any, kind: str, content: Any,
+                      error: Optional[Exception]) -> Optional[Dict]:
+        """Log the outcome of a parse and return the parsed content"""
+        label = 'YAML' if kind == 'yaml' else 'JSON'
+        if error is None:
+            self.log_success(f"{label} syntax valid: {file_path}")
             return content
-        except yaml.YAMLError as e:
-            self.log_error(f"YAML syntax error in {file_path}: {e}")
-            return None
-        except FileNotFoundError:
+        if isinstance(error, FileNotFoundError):
             self.log_error(f"File not found: {file_path}")
-            return None
+        else:
+            self.log_error(f"{label} syntax error in {file_path}: {error}")
+        return None
+    
+    def validate_yaml_file(self, file_path: Path) -> Optional[Dict]:
+        """Validate YAML file syntax and return parsed content"""
+        return self._report_parse(*self._parse_one((file_path, 'yaml')))
     
     def validate_json_file(self, file_path: Path) -> Optional[Dict]:
         """Validate JSON file syntax and return parsed content"""
-        try:
-            with open(file_path, 'r') as f:
-                content = json.load(f)
-            self.log_success(f"JSON syntax valid: {file_path}")
-            return content
-        except json.JSONDecodeError as e:
-            self.log_error(f"JSON syntax error in {file_path}: {e}")
-            return None
-        except FileNotFoundError:
-            self.log_error(f"File not found: {file_path}")
-            return None
+        return self._report_parse(*self._parse_one((file_path, 'json')))
+    
+    def validate_schema(self, name: str, config: Dict) -> bool:
+        """Validate config structure against a compiled JSON schema"""
+        schema = _schema(name)
+        errors_before = self.error_count
+        
+        # Top-level sections are checked the same way with or without fastjsonschema
+        for key in schema.get('required', []):
+            if key not in config:
+                self.log_error(f"Missing required section: {key}")
+        if schema.get('additionalProperties') is False:
+            unknown = config.keys() - schema.get('properties', {}).keys()
+            for key in sorted(unknown, key=str):
+                self.log_error(f"Unknown top-level section: {key}")
+        
+        # Nested sections are checked unit by unit so each object is reported independently
+        checks, complete = _schema_checks(name)
+        for path, check in checks:
+            value = config
+            for key in path:
+                value = value.get(key, _MISSING) if isinstance(value, dict) else _MISSING
+            # A null section is present and checked; only an absent one is skipped
+            if value is _MISSING:
+                continue
+            message = check(value)
+            if message:
+                self.log_error(f"{name}: {'.'.join(path)}{message}")
+        
+        if self.error_count > errors_before:
+            return False
+        if not complete:
+            self.log_warning(f"{name}: fastjsonschema not installed, only section types checked")
+            return True
+        self.log_success(f"{name}: structure valid")
+        return True
     
     def validate_network_config(self, config: Dict) -> bool:
         """Validate network configuration"""
@@ -70,17 +379,16 @@ class ConfigValidator:
         # Validate subnet format
         default_subnet = network_section.get('default_subnet')
         if default_subnet:
-            try:
-                ipaddress.ip_network(default_subnet, strict=False)
+            if _is_cidr(default_subnet):
                 self.log_success(f"Valid subnet format: {default_subnet}")
-            except ValueError:
+            else:
                 self.log_error(f"Invalid subnet format: {default_subnet}")
         
         # Validate gateway IP
         default_gateway = network_section.get('default_gateway')
         if default_gateway:
             try:
-                ipaddress.ip_address(default_gateway)
+                _ipaddress().ip_address(default_gateway)
                 self.log_success(f"Valid gateway IP: {default_gateway}")
             except ValueError:
                 self.log_error(f"Invalid gateway IP: {default_gateway}")
@@ -88,10 +396,9 @@ class ConfigValidator:
         # Validate scan ranges
         scan_ranges = network_section.get('scan_ranges', [])
         for range_item in scan_ranges:
-            try:
-                ipaddress.ip_network(range_item, strict=False)
+            if _is_cidr(range_item):
                 self.log_success(f"Valid scan range: {range_item}")
-            except ValueError:
+            else:
                 self.log_error(f"Invalid scan range: {range_item}")
         
         return True
@@ -101,28 +408,24 @@ class ConfigValidator:
         if not config:
             return False
         
-        # Check required sections
-        required_sections = ['global', 'vm_standards', 'services']
-        for section in required_sections:
-            if section not in config:
-                self.log_error(f"Missing required section: {section}")
-            else:
-                self.log_success(f"Found required section: {section}")
+        # Sections below are walked without further type checks once the schema passes
+        if not self.validate_schema('homelab-config', config):
+            return False
         
-        # Validate VM ID ranges
+        # Validate VM ID ranges; every entry is reported, not just the first bad one
         vm_standards = config.get('vm_standards', {})
         vmid_ranges = vm_standards.get('vmid_ranges', {})
         
         for service, range_str in vmid_ranges.items():
-            if '-' in range_str:
-                try:
-                    start, end = map(int, range_str.split('-'))
-                    if start >= end:
-                        self.log_error(f"Invalid VMID range for {service}: {range_str}")
-                    else:
-                        self.log_success(f"Valid VMID range for {service}: {range_str}")
-                except ValueError:
-                    self.log_error(f"Invalid VMID range format for {service}: {range_str}")
+            match = _VMID_RANGE_RE.fullmatch(range_str) if isinstance(range_str, str) else None
+            if not match:
+                self.log_error(f"Invalid VMID range format for {service}: {range_str}")
+                continue
+            start, end = map(int, match.groups())
+            if start >= end:
+                self.log_error(f"Invalid VMID range for {service}: {range_str}")
+            else:
+                self.log_success(f"Valid VMID range for {service}: {range_str}")
         
         # Validate port mappings
         migration = config.get('migration', {})
@@ -132,18 +435,18 @@ class ConfigValidator:
             try:
                 old_port_int = int(old_port)
                 new_port_int = int(new_port)
-                if not (1 <= old_port_int <= 65535) or not (1 <= new_port_int <= 65535):
-                    self.log_error(f"Invalid port range: {old_port} -> {new_port}")
-                else:
-                    self.log_success(f"Valid port mapping: {old_port} -> {new_port}")
-            except ValueError:
+            except (TypeError, ValueError):
                 self.log_error(f"Invalid port format: {old_port} -> {new_port}")
+                continue
+            if not (1 <= old_port_int <= 65535) or not (1 <= new_port_int <= 65535):
+                self.log_error(f"Invalid port range: {old_port} -> {new_port}")
+            else:
+                self.log_success(f"Valid port mapping: {old_port} -> {new_port}")
         
         return True
     
-    def validate_docker_compose(self, file_path: Path) -> bool:
+    def validate_docker_compose(self, config: Dict) -> bool:
         """Validate Docker Compose configuration"""
-        config = self.validate_yaml_file(file_path)
         if not config:
             return False
         
@@ -205,10 +508,9 @@ class ConfigValidator:
             for net_config in ipam_config:
                 subnet = net_config.get('subnet')
                 if subnet:
-                    try:
-                        ipaddress.ip_network(subnet, strict=False)
+                    if _is_cidr(subnet):
                         self.log_success(f"Network {network_name}: Valid subnet {subnet}")
-                    except ValueError:
+                    else:
                         self.log_error(f"Network {network_name}: Invalid subnet {subnet}")
     
     def validate_api_config(self, config: Dict) -> bool:
@@ -216,6 +518,9 @@ class ConfigValidator:
         if not config:
             return False
         
+        if not self.validate_schema('api-config', config):
+            return False
+        
         # Check CORS configuration
         cors = config.get('cors', {})
         if cors:
@@ -236,75 +541,126 @@ class ConfigValidator:
         
         return True
     
+    # Files checked by run_validation, relative to the project root
+    CONFIG_FILES = [
+        'config/homelab-config.yaml',
+        'config/network-config.yaml',
+        'docker/docker-compose.yaml',
+        '.github/workflows/yaml-lint.yml',
+        'docker/services/idrac-manager/config/api-config.json',
+        '.vscode/settings.json',
+        '.vscode/tasks.json'
+    ]
+    
+    KIND_BY_SUFFIX = {'.yaml': 'yaml', '.yml': 'yaml', '.json': 'json'}
+    
+    # Semantic validator method names by file name; files not listed only get a
+    # syntax check. Names are resolved on the instance so subclass overrides apply
+    VALIDATOR_BY_BASENAME = {
+        'homelab-config.yaml': 'validate_homelab_config',
+        'network-config.yaml': 'validate_network_config',
+        'docker-compose.yaml': 'validate_docker_compose',
+        'api-config.json': 'validate_api_config'
+    }
+    
     def run_validation(self) -> bool:
         """Run all validations"""
-        print("🔍 Starting configuration validation...")
-        print("=" * 50)
-        
-        # Validate YAML files
-        yaml_files = [
-            'config/homelab-config.yaml',
-            'config/network-config.yaml',
-            'docker/docker-compose.yaml',
-            '.github/workflows/yaml-lint.yml'
-        ]
-        
-        for yaml_file in yaml_files:
-            file_path = self.project_root / yaml_file
-            if file_path.exists():
-                if 'homelab-config' in yaml_file:
-                    config = self.validate_yaml_file(file_path)
-                    self.validate_homelab_config(config)
-                elif 'network-config' in yaml_file:
-                    config = self.validate_yaml_file(file_path)
-                    self.validate_network_config(config)
-                elif 'docker-compose' in yaml_file:
-                    self.validate_docker_compose(file_path)
-                else:
-                    self.validate_yaml_file(file_path)
-            else:
-                self.log_warning(f"File not found: {yaml_file}")
-        
-        # Validate JSON files
-        json_files = [
-            'docker/services/idrac-manager/config/api-config.json',
-            '.vscode/settings.json',
-            '.vscode/tasks.json'
-        ]
-        
-        for json_file in json_files:
-            file_path = self.project_root / json_file
-            if file_path.exists():
-                if 'api-config' in json_file:
-                    config = self.validate_json_file(file_path)
-                    self.validate_api_config(config)
+        try:
+            self._emit("🔍 Starting configuration validation...")
+            self._emit("=" * 50)
+            
+            # Resolve every target up front; files unchanged since an error-free run are not parsed
+            config_files = []
+            for config_file in self.CONFIG_FILES:
+                validator_name = self.VALIDATOR_BY_BASENAME.get(Path(config_file).name)
+                validator = getattr(self, validator_name) if validator_name else None
+                config_files.append((config_file, self.KIND_BY_SUFFIX[Path(config_file).suffix], validator))
+            
+            present = self._scan_present([self.project_root / config_file for config_file in self.CONFIG_FILES])
+            targets = []
+            unchanged = set()
+            for config_file, kind, _ in config_files:
+                file_path = str(self.project_root / config_file)
+                if file_path in present:
+                    entry = self._cache.get(config_file, {})
+                    if entry.get('stat') == self._stat_key(present[file_path]):
+                        unchanged.add(config_file)
+                    else:
+                        targets.append((file_path, kind))
+            parsed = {result[0]: result for result in map(self._parse_one, targets)}
+            
+            # Report and run semantic validators in file order
+            for config_file, _, validator in config_files:
+                file_path = str(self.project_root / config_file)
+                if config_file in unchanged:
+                    self.log_success(f"Unchanged since last error-free validation: {file_path}")
+                    self._replay_warnings(config_file)
+                    continue
+                if file_path not in parsed:
+                    self.log_warning(f"File not found: {config_file}")
+                    continue
+                errors_before = self.error_count
+                warnings_before = len(self.warnings)
+                config = self._report_parse(*parsed[file_path])
+                if config is None:
+                    self._cache.pop(config_file, None)
+                    if validator:
+                        validator(config)
+                    continue
+                
+                if not self.use_cache:
+                    if validator:
+                        validator(config)
+                    continue
+                
+                # An edit that only touched comments or formatting hashes the same
+                content_hash = self._content_hash(config)
+                if self._cache.get(config_file, {}).get('hash') == content_hash:
+                    self.log_success(f"Content unchanged since last error-free validation: {file_path}")
+                    self._replay_warnings(config_file)
+                elif validator:
+                    validator(config)
+                
+                # Files without errors are skipped next time; their warnings are kept to replay
+                if self.error_count == errors_before:
+                    self._cache[config_file] = {'stat': self._stat_key(present[file_path]), 'hash': content_hash,
+                                                'warnings': self.warnings[warnings_before:]}
                 else:
-                    self.validate_json_file(file_path)
-            else:
-                self.log_warning(f"File not found: {json_file}")
-        
-        # Print summary
-        print("\n" + "=" * 50)
-        print("📊 Validation Summary:")
-        print(f"✅ Successes: {len([msg for msg in self.warnings + self.errors if '✅' in str(msg)])}")
-        print(f"⚠️  Warnings: {len(self.warnings)}")
-        print(f"❌ Errors: {len(self.errors)}")
-        
-        if self.errors:
-            print("\n❌ Errors found:")
-            for error in self.errors:
-                print(f"  {error}")
-        
-        if self.warnings:
-            print("\n⚠️  Warnings:")
-            for warning in self.warnings:
-                print(f"  {warning}")
-        
-        return len(self.errors) == 0
+                    self._cache.pop(config_file, None)
+            
+            if self.use_cache:
+                self._save_cache()
+            
+            # Print summary
+            self._emit("\n" + "=" * 50)
+            self._emit("📊 Validation Summary:")
+            self._emit(f"✅ Successes: {self.successes}")
+            self._emit(f"⚠️  Warnings: {self.warning_count}")
+            self._emit(f"❌ Errors: {self.error_count}")
+            
+            if self.errors:
+                self._emit("\n❌ Errors found:")
+                for error in self.errors:
+                    self._emit(f"  ❌ ERROR: {error}")
+            
+            if self.warnings:
+                self._emit("\n⚠️  Warnings:")
+                for warning in self.warnings:
+                    self._emit(f"  ⚠️  WARNING: {warning}")
+            
+            return self.error_count == 0
+        finally:
+            # Buffered output must reach stdout even if a check raises
+            self.flush_output()
 
 def main():
     """Main function"""
-    validator = ConfigValidator()
+    parser = argparse.ArgumentParser(description="Validate ProxMox homelab configuration files")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"Revalidate every file, ignoring and not writing {CACHE_FILE}")
+    args = parser.parse_args()
+    
+    validator = ConfigValidator(use_cache=not args.no_cache)
     success = validator.run_validation()
     
     if success: